@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import asyncio
+import aiohttp
+
+# Maximum number of requests in flight for one AsyncRiotClient
+DEFAULT_CONCURRENCY = 10
+
+async def _get_json(session, url, api_key, semaphore, error_message):
+    """
+    Sends a GET request to the Riot Games API and returns the decoded JSON.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the request.
+    url (str): The URL to request.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+    error_message (str): Message printed with the status code when the request fails.
+
+    Returns:
+    The decoded JSON, or None if an error occurs.
+    """
+    headers = {"X-Riot-Token": api_key}
+    async with semaphore:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 200:
+                return await response.json()
+            print(f"{error_message}: {response.status}")
+            return None
+
+async def fetch_summoner_details(session, summoner_name, api_key, semaphore):
+    """
+    Fetches the summoner ID and PUUID from Riot Games API.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the request.
+    summoner_name (str): The name of the summoner.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+
+    Returns:
+    tuple: A tuple containing the summoner ID and PUUID, or (None, None) if an error occurs.
+
+    Example:
+    summoner_id, puuid = await fetch_summoner_details(session, 'SUMMONER_NAME', 'YOUR_RIOT_API_KEY', semaphore)
+    """
+    url = f"https://na1.api.riotgames.com/lol/summoner/v4/summoners/by-name/{summoner_name}"
+    data = await _get_json(session, url, api_key, semaphore, "Failed to retrieve summoner details")
+    if data is None:
+        return None, None
+    return data.get("id"), data.get("puuid")
+
+async def fetch_tft_league_entries(session, summoner_id, api_key, semaphore):
+    """
+    Fetches the TFT league entries of a summoner.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the request.
+    summoner_id (str): The ID of the summoner.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+
+    Returns:
+    list: A list of league entries, or None if an error occurs.
+    """
+    url = f"https://na1.api.riotgames.com/tft/league/v1/entries/by-summoner/{summoner_id}"
+    return await _get_json(session, url, api_key, semaphore, "Failed to retrieve TFT league data")
+
+async def fetch_match_history(session, puuid, api_key, semaphore):
+    """
+    Fetches the match history for a given PUUID.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the request.
+    puuid (str): The PUUID of the summoner.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+
+    Returns:
+    list: A list of match IDs, or None if an error occurs.
+
+    Example:
+    match_ids = await fetch_match_history(session, 'SUMMONER_PUUID', 'YOUR_RIOT_API_KEY', semaphore)
+    """
+    url = f"https://americas.api.riotgames.com/tft/match/v1/matches/by-puuid/{puuid}/ids?start=0&count=20"
+    return await _get_json(session, url, api_key, semaphore, "Failed to retrieve match history")
+
+async def fetch_match_details(session, match_id, api_key, semaphore):
+    """
+    Fetches details of a specific match.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the request.
+    match_id (str): The ID of the match.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+
+    Returns:
+    dict: A dictionary containing match details, or None if an error occurs.
+    """
+    url = f"https://americas.api.riotgames.com/tft/match/v1/matches/{match_id}"
+    return await _get_json(session, url, api_key, semaphore, "Failed to retrieve match details")
+
+async def fetch_many_match_details(session, match_ids, api_key, semaphore):
+    """
+    Fetches the details of several matches concurrently.
+
+    All requests share the given semaphore, so no more requests are in flight at once
+    than the semaphore allows.
+
+    Parameters:
+    session (aiohttp.ClientSession): The session used to send the requests.
+    match_ids (list): The IDs of the matches.
+    api_key (str): The API key for Riot Games API.
+    semaphore (asyncio.Semaphore): Shared limit on the number of concurrent requests.
+
+    Returns:
+    list: The match details in the order of match_ids, with None for matches that failed.
+
+    Example:
+    matches = await fetch_many_match_details(session, match_ids, 'YOUR_RIOT_API_KEY', semaphore)
+    """
+    return await asyncio.gather(
+        *(fetch_match_details(session, match_id, api_key, semaphore) for match_id in match_ids)
+    )
+
+class AsyncRiotClient:
+    """
+    Owns one aiohttp session and one semaphore shared by every request made through it.
+
+    The session and semaphore are created on first use, inside the running event loop,
+    so a client must only be used from one event loop.
+
+    Parameters:
+    api_key (str): The API key for Riot Games API.
+    concurrency (int, optional): Maximum number of requests in flight. Defaults to DEFAULT_CONCURRENCY.
+    session (aiohttp.ClientSession, optional): An existing session to use. It is not closed by the client.
+
+    Example:
+    async with AsyncRiotClient('YOUR_RIOT_API_KEY') as client:
+        match_ids = await client.fetch_match_history('SUMMONER_PUUID')
+        matches = await client.fetch_many_match_details(match_ids)
+    """
+
+    def __init__(self, api_key, concurrency=DEFAULT_CONCURRENCY, session=None):
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = None
+
+    def _resources(self):
+        """
+        Returns the session and semaphore, creating them on first use.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session, self._semaphore
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+        return False
+
+    async def close(self):
+        """
+        Closes the session if the client created it.
+
+        The client can be used again afterwards, including from another event loop.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+        # The semaphore belongs to the current event loop, so a reused client needs a new one
+        self._semaphore = None
+
+    async def fetch_summoner_details(self, summoner_name):
+        """
+        Fetches the summoner ID and PUUID, or (None, None) if an error occurs.
+        """
+        session, semaphore = self._resources()
+        return await fetch_summoner_details(session, summoner_name, self.api_key, semaphore)
+
+    async def fetch_tft_league_entries(self, summoner_id):
+        """
+        Fetches the TFT league entries of a summoner, or None if an error occurs.
+        """
+        session, semaphore = self._resources()
+        return await fetch_tft_league_entries(session, summoner_id, self.api_key, semaphore)
+
+    async def fetch_match_history(self, puuid):
+        """
+        Fetches the match IDs of a PUUID, or None if an error occurs.
+        """
+        session, semaphore = self._resources()
+        return await fetch_match_history(session, puuid, self.api_key, semaphore)
+
+    async def fetch_match_details(self, match_id):
+        """
+        Fetches the details of a match, or None if an error occurs.
+        """
+        session, semaphore = self._resources()
+        return await fetch_match_details(session, match_id, self.api_key, semaphore)
+
+    async def fetch_many_match_details(self, match_ids):
+        """
+        Fetches the details of several matches concurrently, with None for matches that failed.
+        """
+        session, semaphore = self._resources()
+        return await fetch_many_match_details(session, match_ids, self.api_key, semaphore)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+def _index_of(vocabulary, key):
+    """
+    Returns the column of a key in the vocabulary, adding it if it is new.
+    """
+    column = vocabulary.get(key)
+    if column is None:
+        column = vocabulary[key] = len(vocabulary)
+    return column
+
+def _incidence(rows, columns, shape, binary=False):
+    """
+    Builds a CSR incidence matrix from row/column coordinates.
+    """
+    matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.float64), (rows, columns)), shape=shape)
+    if binary:
+        matrix.data[:] = 1
+    return matrix
+
+def _accumulate(total, batch):
+    """
+    Adds a batch matrix to the running total, growing the total to the batch shape.
+    """
+    if total is None:
+        return batch
+    total.resize(batch.shape)
+    return total + batch
+
+def _process_batch(batch, vocabularies):
+    """
+    Computes the co-occurrence and placement-weighted matrices of one batch of matches.
+    """
+    champions, items, traits = vocabularies['champion'], vocabularies['item'], vocabularies['trait']
+    board_placements, unit_placements = [], []
+    board_champion = ([], [])
+    board_trait = ([], [])
+    unit_champion = []
+    unit_item = ([], [])
+
+    for match in batch:
+        if not match:
+            continue
+        for participant in match['info']['participants']:
+            board = len(board_placements)
+            board_placements.append(participant['placement'])
+            for unit in participant['units']:
+                champion = _index_of(champions, unit['character_id'])
+                board_champion[0].append(board)
+                board_champion[1].append(champion)
+                unit_row = len(unit_champion)
+                unit_champion.append(champion)
+                unit_placements.append(participant['placement'])
+                for item in unit.get('itemNames', []):
+                    unit_item[0].append(unit_row)
+                    unit_item[1].append(_index_of(items, item))
+            for trait in participant['traits']:
+                if trait['tier_current'] > 0:  # Only count active traits
+                    board_trait[0].append(board)
+                    board_trait[1].append(_index_of(traits, trait['name']))
+
+    num_boards, num_units = len(board_placements), len(unit_champion)
+    # Boards count a champion once even when it is fielded twice
+    bc = _incidence(*board_champion, (num_boards, len(champions)), binary=True)
+    bt = _incidence(*board_trait, (num_boards, len(traits)), binary=True)
+    uc = _incidence(np.arange(num_units), unit_champion, (num_units, len(champions)))
+    ui = _incidence(*unit_item, (num_units, len(items)))
+    board_weights = sparse.diags(np.asarray(board_placements, dtype=np.float64))
+    unit_weights = sparse.diags(np.asarray(unit_placements, dtype=np.float64))
+
+    return {
+        'champion_item': (uc.T @ ui).tocsr(),
+        'champion_item_placement': (uc.T @ unit_weights @ ui).tocsr(),
+        'champion_champion': (bc.T @ bc).tocsr(),
+        'champion_champion_placement': (bc.T @ board_weights @ bc).tocsr(),
+        'trait_trait': (bt.T @ bt).tocsr(),
+        'trait_trait_placement': (bt.T @ board_weights @ bt).tocsr(),
+        'champion_units': np.asarray(uc.sum(axis=0)).ravel(),
+        'item_units': np.asarray(ui.sum(axis=0)).ravel(),
+        'boards': num_boards,
+        'units': num_units,
+    }
+
+def build_cooccurrence(matches, batch_size=1000):
+    """
+    Builds sparse co-occurrence and placement-weighted matrices over a match corpus.
+
+    Matches are processed in batches: each batch is turned into sparse incidence matrices
+    (boards x champions, boards x traits, units x champions, units x items) and the pair
+    counts are obtained with sparse matrix products, so memory stays proportional to the
+    number of pairs that actually occur rather than the vocabulary size squared.
+
+    Parameters:
+    matches (iterable): Match details. Can be a generator.
+    batch_size (int, optional): Number of matches processed per batch. Defaults to 1000.
+
+    Returns:
+    dict: The vocabularies ('champions', 'items', 'traits'), the count matrices
+    ('champion_item', 'champion_champion', 'trait_trait'), their placement sums
+    (suffixed '_placement'), the per-champion and per-item unit totals and the number
+    of boards and units analyzed.
+
+    Example:
+    cooccurrence = build_cooccurrence(match_data)
+    """
+    vocabularies = {'champion': {}, 'item': {}, 'trait': {}}
+    totals = {}
+    boards = units = 0
+
+    def merge(batch):
+        nonlocal boards, units
+        result = _process_batch(batch, vocabularies)
+        for key, value in result.items():
+            if key == 'boards':
+                boards += value
+            elif key == 'units':
+                units += value
+            elif isinstance(value, np.ndarray):
+                previous = totals.get(key, np.zeros(0))
+                grown = np.zeros(len(value))
+                grown[:len(previous)] = previous
+                totals[key] = grown + value
+            else:
+                totals[key] = _accumulate(totals.get(key), value)
+
+    batch = []
+    for match in matches:
+        batch.append(match)
+        if len(batch) >= batch_size:
+            merge(batch)
+            batch = []
+    if batch or not totals:
+        merge(batch)
+
+    # Earlier batches may have been built before later vocabulary entries appeared
+    sizes = {name: len(vocabulary) for name, vocabulary in vocabularies.items()}
+    shapes = {
+        'champion_item': (sizes['champion'], sizes['item']),
+        'champion_champion': (sizes['champion'], sizes['champion']),
+        'trait_trait': (sizes['trait'], sizes['trait']),
+    }
+    for key, shape in shapes.items():
+        for name in (key, f"{key}_placement"):
+            totals[name].resize(shape)
+    for key, size in (('champion_units', sizes['champion']), ('item_units', sizes['item'])):
+        grown = np.zeros(size)
+        grown[:len(totals[key])] = totals[key]
+        totals[key] = grown
+
+    totals['champions'] = list(vocabularies['champion'])
+    totals['items'] = list(vocabularies['item'])
+    totals['traits'] = list(vocabularies['trait'])
+    totals['boards'] = boards
+    totals['units'] = units
+    return totals
+
+def _values_at(matrix, rows, columns):
+    """
+    Reads the entries of a sparse matrix at the given coordinates.
+    """
+    # Fancy indexing a sparse matrix with empty coordinates does not return an empty array
+    if len(rows) == 0:
+        return np.empty(0)
+    return np.asarray(matrix[rows, columns]).ravel()
+
+def average_placement(counts, placement_sums):
+    """
+    Derives the average placement of every pair from its count and placement sum.
+
+    Parameters:
+    counts (scipy.sparse matrix): Pair counts.
+    placement_sums (scipy.sparse matrix): Placement sums for the same pairs.
+
+    Returns:
+    scipy.sparse.csr_matrix: Average placement for every pair that occurred.
+    """
+    return sparse.csr_matrix(placement_sums.multiply(counts.power(-1)))
+
+def lift(counts, row_totals, column_totals, total):
+    """
+    Computes the lift of every pair: P(a and b) / (P(a) * P(b)).
+
+    A lift above 1 means the pair shows up together more often than chance.
+
+    Parameters:
+    counts (scipy.sparse matrix): Pair counts.
+    row_totals (array-like): Occurrences of every row key.
+    column_totals (array-like): Occurrences of every column key.
+    total (int): Number of observations (boards or units).
+
+    Returns:
+    scipy.sparse.csr_matrix: Lift for every pair that occurred.
+    """
+    def inverse(values):
+        values = np.asarray(values, dtype=np.float64)
+        return np.divide(1.0, values, out=np.zeros_like(values), where=values > 0)
+
+    return (sparse.diags(inverse(row_totals)) @ counts @ sparse.diags(inverse(column_totals))).tocsr() * total
+
+def cooccurrence_frame(cooccurrence, kind, min_count=1):
+    """
+    Lists the pairs of one co-occurrence matrix with their count, average placement and lift.
+
+    Parameters:
+    cooccurrence (dict): The result of build_cooccurrence.
+    kind (str): One of 'champion_item', 'champion_champion' or 'trait_trait'.
+    min_count (int, optional): Minimum number of occurrences of a pair. Defaults to 1.
+
+    Returns:
+    pd.DataFrame: One row per pair, sorted by count then average placement.
+
+    Example:
+    pairs_df = cooccurrence_frame(cooccurrence, 'champion_item', min_count=20)
+    """
+    counts = cooccurrence[kind]
+    averages = average_placement(counts, cooccurrence[f"{kind}_placement"])
+    if kind == 'champion_item':
+        rows, columns = cooccurrence['champions'], cooccurrence['items']
+        pair_lift = lift(counts, cooccurrence['champion_units'], cooccurrence['item_units'], cooccurrence['units'])
+    else:
+        rows = columns = cooccurrence['champions'] if kind == 'champion_champion' else cooccurrence['traits']
+        # The diagonal of a symmetric matrix holds the number of boards with each key
+        diagonal = counts.diagonal()
+        pair_lift = lift(counts, diagonal, diagonal, cooccurrence['boards'])
+        # Keep every unordered pair once and drop the diagonal
+        counts = sparse.triu(counts, k=1).tocsr()
+
+    coo = counts.tocoo()
+    keep = coo.data >= min_count
+    row_index, column_index = coo.row[keep], coo.col[keep]
+    pairs_df = pd.DataFrame({
+        'First': [rows[i] for i in row_index],
+        'Second': [columns[j] for j in column_index],
+        'Count': coo.data[keep].astype(int),
+        'Average Placement': _values_at(averages, row_index, column_index),
+        'Lift': _values_at(pair_lift, row_index, column_index),
+    })
+    pairs_df.sort_values(by=['Count', 'Average Placement'], ascending=[False, True], inplace=True)
+    return pairs_df.reset_index(drop=True)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import json
+import mmap
+import os
+import zstandard as zstd
+
+# Size in bytes of the trained compression dictionary
+DEFAULT_DICT_SIZE = 112 * 1024
+# zstd compression level used when appending matches
+DEFAULT_LEVEL = 10
+
+DICTIONARY_FILE = 'dictionary.zdict'
+DATA_FILE = 'matches.zst'
+INDEX_FILE = 'index.tsv'
+
+def _encode(match):
+    """
+    Serializes a match to compact JSON bytes.
+    """
+    return json.dumps(match, separators=(',', ':')).encode('utf-8')
+
+class MatchArchive:
+    """
+    Append-only archive of raw match JSON compressed with a shared zstd dictionary.
+
+    Raw matches repeat the same keys, character IDs and item names, so a dictionary
+    trained on a sample of matches lets every match be compressed as its own small
+    frame while still compressing well. An archive is a directory holding the
+    dictionary, the concatenated frames and a tab-separated index of
+    match ID, offset and length, which gives random access by match ID.
+
+    Any number of readers can open an archive, but only one process should append to
+    it at a time. Opening an archive never modifies it.
+
+    Parameters:
+    path (str): The directory of an archive created with MatchArchive.create.
+    level (int, optional): Compression level used by append. Defaults to DEFAULT_LEVEL.
+
+    Example:
+    with MatchArchive('season_archive') as archive:
+        champion_count, trait_count, item_count = frequency_analysis(archive)
+    """
+
+    def __init__(self, path, level=DEFAULT_LEVEL):
+        self.path = path
+        with open(os.path.join(path, DICTIONARY_FILE), 'rb') as f:
+            dictionary = zstd.ZstdCompressionDict(f.read())
+        self._compressor = zstd.ZstdCompressor(level=level, dict_data=dictionary)
+        self._decompressor = zstd.ZstdDecompressor(dict_data=dictionary)
+        self._index = self._load_index()
+        self._data = open(os.path.join(path, DATA_FILE), 'a+b')
+        self._mmap = None
+        # Number of running streams per memory map, keyed by id of the map
+        self._readers = {}
+
+    def _load_index(self):
+        """
+        Reads the index file, ignoring a partial last line left by an interrupted append.
+
+        The file itself is not modified; append removes the partial line before writing.
+        """
+        index = {}
+        index_path = os.path.join(self.path, INDEX_FILE)
+        with open(index_path, 'rb') as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines, start=1):
+            fields = line.decode('utf-8', errors='replace').rstrip('\n').split('\t')
+            if not line.endswith(b'\n') or len(fields) != 3 or not (fields[1].isdigit() and fields[2].isdigit()):
+                if number < len(lines):
+                    raise ValueError(f"Corrupt line {number} in {index_path}")
+                break
+            index[fields[0]] = (int(fields[1]), int(fields[2]))
+        return index
+
+    @classmethod
+    def create(cls, path, sample_matches, dict_size=DEFAULT_DICT_SIZE, level=DEFAULT_LEVEL):
+        """
+        Creates an empty archive with a dictionary trained on sample matches.
+
+        zstd needs a reasonably large sample to train a dictionary; a few hundred
+        matches is usually enough.
+
+        Parameters:
+        path (str): The directory to create. It must not exist yet.
+        sample_matches (list): Match details to train the dictionary on.
+        dict_size (int, optional): Size of the dictionary in bytes. Defaults to DEFAULT_DICT_SIZE.
+        level (int, optional): Compression level used by append. Defaults to DEFAULT_LEVEL.
+
+        Returns:
+        MatchArchive: The opened archive.
+        """
+        samples = [_encode(match) for match in sample_matches if match]
+        dictionary = zstd.train_dictionary(dict_size, samples)
+        os.makedirs(path)
+        with open(os.path.join(path, DICTIONARY_FILE), 'wb') as f:
+            f.write(dictionary.as_bytes())
+        open(os.path.join(path, DATA_FILE), 'wb').close()
+        open(os.path.join(path, INDEX_FILE), 'w', encoding='utf-8').close()
+        return cls(path, level=level)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, match_id):
+        return match_id in self._index
+
+    def __iter__(self):
+        return self.iter_matches()
+
+    def close(self):
+        """
+        Closes the files of the archive.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._data.close()
+
+    def match_ids(self):
+        """
+        Returns the IDs of the archived matches in the order they were appended.
+        """
+        return list(self._index)
+
+    def append(self, matches):
+        """
+        Appends matches to the archive, skipping matches that are already archived.
+
+        Parameters:
+        matches (iterable): Match details, as returned by fetch_match_details.
+
+        Returns:
+        int: The number of matches appended.
+        """
+        frames = []
+        entries = []
+        appended = set()
+        offset = self._data.seek(0, os.SEEK_END)
+        for match in matches:
+            if not match:
+                continue
+            match_id = match['metadata']['match_id']
+            if match_id in self._index or match_id in appended:
+                continue
+            frame = self._compressor.compress(_encode(match))
+            frames.append(frame)
+            entries.append((match_id, offset, len(frame)))
+            appended.add(match_id)
+            offset += len(frame)
+        if not frames:
+            return 0
+
+        # Data is written before the index so an interrupted append never indexes missing bytes
+        self._data.write(b''.join(frames))
+        self._data.flush()
+        with open(os.path.join(self.path, INDEX_FILE), 'r+b') as f:
+            # A partial line left by an interrupted append would corrupt the next entry
+            _truncate_partial_line(f)
+            f.seek(0, os.SEEK_END)
+            f.write(''.join(f"{match_id}\t{start}\t{length}\n" for match_id, start, length in entries).encode('utf-8'))
+        for match_id, start, length in entries:
+            self._index[match_id] = (start, length)
+        # New reads map the grown file; a map still used by a stream is closed when the stream ends
+        previous, self._mmap = self._mmap, None
+        if previous is not None and id(previous) not in self._readers:
+            previous.close()
+        return len(frames)
+
+    def _buffer(self):
+        """
+        Returns a memory map of the data file, reopening it after appends.
+        """
+        if self._mmap is None:
+            self._mmap = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get(self, match_id):
+        """
+        Returns the details of an archived match, or None if it is not in the archive.
+        """
+        entry = self._index.get(match_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        return json.loads(self._decompressor.decompress(self._buffer()[offset:offset + length]))
+
+    def iter_matches(self, match_ids=None):
+        """
+        Streams archived matches one by one.
+
+        Parameters:
+        match_ids (iterable, optional): The matches to stream. Defaults to every match,
+        in the order they were appended, which reads the data file sequentially.
+
+        Yields:
+        dict: Match details.
+        """
+        if not self._index:
+            return
+        buffer = self._buffer()
+        self._readers[id(buffer)] = self._readers.get(id(buffer), 0) + 1
+        decompress = self._decompressor.decompress
+        # Matches appended while streaming are not part of this stream
+        index = dict(self._index)
+        entries = index.values() if match_ids is None else (
+            index[match_id] for match_id in match_ids if match_id in index)
+        try:
+            for offset, length in entries:
+                yield json.loads(decompress(buffer[offset:offset + length]))
+        finally:
+            self._readers[id(buffer)] -= 1
+            if not self._readers[id(buffer)]:
+                del self._readers[id(buffer)]
+                if buffer is not self._mmap:
+                    buffer.close()
+
+def _truncate_partial_line(f):
+    """
+    Truncates an index file opened in 'r+b' mode after its last complete line.
+    """
+    size = f.seek(0, os.SEEK_END)
+    block = 256
+    while True:
+        start = max(size - block, 0)
+        f.seek(start)
+        tail = f.read(size - start)
+        if not tail or tail.endswith(b'\n'):
+            return
+        newline = tail.rfind(b'\n')
+        if newline != -1 or start == 0:
+            f.truncate(start + newline + 1)
+            return
+        block *= 2
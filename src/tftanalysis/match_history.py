@@ -4,12 +4,15 @@
 # In[6]:
 
 
+import asyncio
+import concurrent.futures
 import requests
 import pandas as pd
 from tabulate import tabulate
 import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import defaultdict
+from tftanalysis.async_client import AsyncRiotClient, DEFAULT_CONCURRENCY
 
 # Function to retrieve the summoner's PUUID and TFT data
 def fetch_summoner_data(api_key):
@@ -95,6 +98,37 @@ def fetch_match_details(match_id, api_key):
         print(f"Failed to retrieve match details: {response.status_code}")
         return None
 
+# Function to fetch details of all listed matches concurrently
+def fetch_all_match_details(match_ids, api_key, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Fetches the details of several matches concurrently.
+
+    Parameters:
+    match_ids (list): The IDs of the matches.
+    api_key (str): The API key for Riot Games API.
+    concurrency (int, optional): Maximum number of requests in flight. Defaults to DEFAULT_CONCURRENCY.
+
+    Returns:
+    list: A list of match details, skipping matches that could not be retrieved.
+
+    This function blocks until every match is fetched. When an event loop is already
+    running (for example in Jupyter), the requests run on a worker thread with their own
+    loop; async code should await AsyncRiotClient.fetch_many_match_details instead.
+    """
+    async def fetch_all():
+        async with AsyncRiotClient(api_key, concurrency=concurrency) as client:
+            return await client.fetch_many_match_details(match_ids)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        matches = asyncio.run(fetch_all())
+    else:
+        # asyncio.run cannot be nested inside a running loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            matches = executor.submit(asyncio.run, fetch_all()).result()
+    return [match for match in matches if match]
+
 def get_api_key_from_user():
     """
     Prompts the user to enter their Riot API Key.
@@ -105,20 +139,21 @@ def get_api_key_from_user():
     api_key = input("Please enter your Riot API Key: ").strip()
     return api_key
 
-def analyze_match(match_details):
+def summarize_match(match_details):
     """
-    Analyzes and displays various statistics from a TFT match.
+    Computes the participant, trait and item statistics of a TFT match.
 
     Parameters:
     match_details (dict): A dictionary containing details of the match.
+
+    Returns:
+    tuple: Three DataFrames for the participants summary, traits analysis and items analysis, respectively.
     """
     # Participant Analysis
     participants_data = match_details['info']['participants']
     participants_df = pd.DataFrame(participants_data)
     summary_columns = ['placement', 'level', 'gold_left', 'players_eliminated', 'time_eliminated', 'total_damage_to_players']
     participants_summary_df = participants_df[summary_columns]
-    print("\nParticipants Summary:")
-    print(tabulate(participants_summary_df, headers='keys', tablefmt='psql', showindex=False))
 
     # Traits Analysis
     traits_analysis = defaultdict(lambda: {'count': 0, 'total_placement': 0, 'avg_placement': 0})
@@ -132,8 +167,6 @@ def analyze_match(match_details):
     traits_df = pd.DataFrame(traits_analysis).T.reset_index()
     traits_df.rename(columns={'index': 'Trait', 'count': 'Usage Count', 'avg_placement': 'Average Placement'}, inplace=True)
     traits_df.sort_values(by=['Usage Count', 'Average Placement'], ascending=[False, True], inplace=True)
-    print("\nTraits Analysis:")
-    print(tabulate(traits_df, headers='keys', tablefmt='psql', showindex=False))
 
     # Items Analysis
     items_analysis = defaultdict(lambda: {'count': 0, 'total_placement': 0, 'avg_placement': 0})
@@ -148,6 +181,21 @@ def analyze_match(match_details):
     items_df = pd.DataFrame(items_analysis).T.reset_index()
     items_df.rename(columns={'index': 'Item', 'count': 'Usage Count', 'avg_placement': 'Average Placement'}, inplace=True)
     items_df.sort_values(by=['Usage Count', 'Average Placement'], ascending=[False, True], inplace=True)
+
+    return participants_summary_df, traits_df, items_df
+
+def analyze_match(match_details):
+    """
+    Analyzes and displays various statistics from a TFT match.
+
+    Parameters:
+    match_details (dict): A dictionary containing details of the match.
+    """
+    participants_summary_df, traits_df, items_df = summarize_match(match_details)
+    print("\nParticipants Summary:")
+    print(tabulate(participants_summary_df, headers='keys', tablefmt='psql', showindex=False))
+    print("\nTraits Analysis:")
+    print(tabulate(traits_df, headers='keys', tablefmt='psql', showindex=False))
     print("\nItems Analysis:")
     print(tabulate(items_df, headers='keys', tablefmt='psql', showindex=False))
 
@@ -167,6 +215,127 @@ def analyze_match(match_details):
     plt.gca().invert_xaxis()
     plt.show()
 
+def _group_placements(df, key):
+    """
+    Aggregates placement statistics of the player's games grouped by a column.
+    """
+    grouped = df.groupby(key).agg(
+        games=('match_id', 'nunique'),
+        avg_placement=('placement', 'mean'),
+        top4_rate=('top4', 'mean'),
+    ).reset_index()
+    grouped.rename(columns={'games': 'Games', 'avg_placement': 'Average Placement', 'top4_rate': 'Top 4 Rate'}, inplace=True)
+    grouped.sort_values(by=['Games', 'Average Placement'], ascending=[False, True], inplace=True)
+    return grouped.reset_index(drop=True)
+
+def analyze_match_history(puuid, matches):
+    """
+    Analyzes the player's own performance across all of the provided matches.
+
+    The player's board is extracted from every match once, then placements, damage,
+    gold, traits and items are aggregated with pandas over the whole history.
+
+    Parameters:
+    puuid (str): The PUUID of the player.
+    matches (list): A list of match details.
+
+    Returns:
+    dict: DataFrames under 'games' (one row per match), 'summary', 'placements'
+    (placement distribution), 'traits' and 'items', or None if the player is in none of the matches.
+
+    Example:
+    history = analyze_match_history('SUMMONER_PUUID', matches)
+    """
+    boards = [
+        dict(participant, match_id=match['metadata']['match_id'])
+        for match in matches if match
+        for participant in match['info']['participants']
+        if participant.get('puuid') == puuid
+    ]
+    if not boards:
+        return None
+
+    boards_df = pd.DataFrame(boards)
+    boards_df['top4'] = boards_df['placement'] <= 4
+    game_columns = ['match_id', 'placement', 'level', 'last_round', 'gold_left',
+                    'players_eliminated', 'time_eliminated', 'total_damage_to_players']
+    games_df = boards_df[[column for column in game_columns if column in boards_df.columns]]
+
+    summary = {
+        'Games': len(boards_df),
+        'Average Placement': boards_df['placement'].mean(),
+        'Top 4 Rate': boards_df['top4'].mean(),
+        'Win Rate': (boards_df['placement'] == 1).mean(),
+    }
+    for label, column in [('Average Damage', 'total_damage_to_players'), ('Average Gold Left', 'gold_left'),
+                          ('Average Level', 'level')]:
+        if column in boards_df.columns:
+            summary[label] = boards_df[column].mean()
+    summary_df = pd.DataFrame([summary])
+
+    placements_df = (boards_df['placement'].value_counts()
+                     .reindex(range(1, 9), fill_value=0)
+                     .rename_axis('Placement').reset_index(name='Games'))
+    placements_df['Share'] = placements_df['Games'] / len(boards_df)
+
+    # One row per active trait of every board
+    traits_df = (boards_df[['match_id', 'placement', 'top4', 'traits']].explode('traits')
+                 .dropna(subset=['traits']).reset_index(drop=True))
+    active = [trait.get('tier_current', 0) > 0 for trait in traits_df['traits']]
+    traits_df = traits_df.loc[pd.Series(active, index=traits_df.index, dtype=bool)].copy()
+    traits_df['Trait'] = [trait['name'] for trait in traits_df.pop('traits')]
+
+    # One row per item held by a unit of every board
+    units_df = (boards_df[['match_id', 'placement', 'top4', 'units']].explode('units')
+                .dropna(subset=['units']).reset_index(drop=True))
+    units_df['Item'] = [unit.get('itemNames', []) for unit in units_df.pop('units')]
+    # A board holding several copies of an item counts once for that game
+    items_df = units_df.explode('Item').dropna(subset=['Item']).drop_duplicates(subset=['match_id', 'Item'])
+
+    return {
+        'games': games_df.reset_index(drop=True),
+        'summary': summary_df,
+        'placements': placements_df,
+        'traits': _group_placements(traits_df, 'Trait'),
+        'items': _group_placements(items_df, 'Item'),
+    }
+
+async def analyze_player_history(client, puuid):
+    """
+    Fetches the recent matches of a player with an existing client and analyzes them.
+
+    Non-interactive entry point for async code, which shares the client's session and
+    concurrency limit instead of starting a new event loop.
+
+    Parameters:
+    client (AsyncRiotClient): The client used to fetch the match history and details.
+    puuid (str): The PUUID of the player.
+
+    Returns:
+    dict: The DataFrames returned by analyze_match_history, or None if no match could be analyzed.
+
+    Example:
+    async with AsyncRiotClient('YOUR_RIOT_API_KEY') as client:
+        history = await analyze_player_history(client, 'SUMMONER_PUUID')
+    """
+    match_ids = await client.fetch_match_history(puuid)
+    if not match_ids:
+        return None
+    matches = await client.fetch_many_match_details(match_ids)
+    return analyze_match_history(puuid, matches)
+
+def display_match_history_analysis(history):
+    """
+    Displays the results of analyze_match_history.
+
+    Parameters:
+    history (dict): The DataFrames returned by analyze_match_history.
+    """
+    for title, key in [('Games', 'games'), ('Summary', 'summary'), ('Placement Distribution', 'placements'),
+                       ('Traits Performance', 'traits'), ('Items Performance', 'items')]:
+        print(f"\n{title}:")
+        print(tabulate(history[key], headers='keys', tablefmt='psql', showindex=False))
+
 def main():
     """
     Main function to run the program.
@@ -183,7 +352,15 @@ def main():
                     print(f"{i}. {match_id}")
 
                 # User selects which match to analyze
-                selection = input("\nEnter the number of the match you want to analyze: ")
+                selection = input("\nEnter the number of the match you want to analyze, or 'all' to analyze the whole history: ")
+                if selection.strip().lower() == 'all':
+                    matches = fetch_all_match_details(match_ids, api_key)
+                    history = analyze_match_history(puuid, matches)
+                    if history:
+                        display_match_history_analysis(history)
+                    else:
+                        print("No matches could be analyzed for this player.")
+                    return
                 try:
                     selected_index = int(selection) - 1
                     if 0 <= selected_index < len(match_ids):
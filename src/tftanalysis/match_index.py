@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import json
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+
+# Function to build an inverted index over stored matches
+def build_match_index(matches):
+    """
+    Builds an inverted index over the participants of the provided matches.
+
+    Every participant (board) gets a row number. Champions, items, traits (with tier)
+    and champion+item pairs are mapped to sorted integer arrays (posting lists) of the
+    rows that contain them, so filtered queries never have to walk the match dicts again.
+
+    Parameters:
+    matches (list): A list of match details.
+
+    Returns:
+    dict: A dictionary with the champion, item and champion+item posting lists under
+    'postings', the trait posting lists under 'traits' (trait name -> {tier: rows}),
+    the placement of every row under 'placements' and the (match_id, puuid) of every
+    row under 'rows'.
+
+    Example:
+    index = build_match_index(match_data)
+    """
+    postings = defaultdict(set)
+    traits = defaultdict(lambda: defaultdict(set))
+    placements = []
+    rows = []
+
+    for match in matches:
+        if not match:
+            continue
+        match_id = match.get('metadata', {}).get('match_id')
+        for participant in match['info']['participants']:
+            row = len(placements)
+            placements.append(participant['placement'])
+            rows.append((match_id, participant.get('puuid')))
+            for unit in participant['units']:
+                champion = unit['character_id']
+                postings[('champion', champion)].add(row)
+                for item in unit.get('itemNames', []):
+                    postings[('item', item)].add(row)
+                    postings[('champion_item', champion, item)].add(row)
+            for trait in participant['traits']:
+                if trait['tier_current'] > 0:  # Only index active traits
+                    traits[trait['name']][trait['tier_current']].add(row)
+
+    def to_array(row_set):
+        return np.fromiter(sorted(row_set), dtype=np.uint32, count=len(row_set))
+
+    return {
+        'postings': {key: to_array(value) for key, value in postings.items()},
+        'traits': {name: {tier: to_array(value) for tier, value in tiers.items()}
+                   for name, tiers in traits.items()},
+        'placements': np.asarray(placements, dtype=np.uint8),
+        'rows': rows,
+    }
+
+def _trait_postings(index, name, min_tier):
+    """
+    Returns the rows where a trait is active at or above the given tier.
+    """
+    tiers = [rows for tier, rows in index['traits'].get(name, {}).items() if tier >= min_tier]
+    if not tiers:
+        return np.empty(0, dtype=np.uint32)
+    return np.unique(np.concatenate(tiers))
+
+def _lookup(index, term):
+    """
+    Returns the posting list for a single query term.
+
+    Terms are tuples: ('champion', id), ('item', name), ('champion_item', id, item)
+    or ('trait', name, min_tier). Unknown terms match no rows.
+    """
+    if term[0] == 'trait':
+        return _trait_postings(index, term[1], term[2] if len(term) > 2 else 1)
+    return index['postings'].get(tuple(term), np.empty(0, dtype=np.uint32))
+
+def query_rows(index, all_of=(), any_of=()):
+    """
+    Returns the rows matching an AND/OR filter.
+
+    Parameters:
+    index (dict): An index created by build_match_index.
+    all_of (iterable, optional): Terms that must all be present on the board.
+    any_of (iterable, optional): Terms of which at least one must be present on the board.
+
+    Returns:
+    numpy.ndarray: The sorted row numbers matching the filter.
+
+    Example:
+    rows = query_rows(index, all_of=[('champion_item', 'TFT10_Ahri', 'TFT_Item_JeweledGauntlet')])
+    """
+    # Terms may come from generators, so they are materialized before checking for emptiness
+    required = [_lookup(index, term) for term in all_of]
+    options = [_lookup(index, term) for term in any_of]
+    if options:
+        required.append(np.unique(np.concatenate(options)))
+    # Start from the shortest list so every intersection shrinks as fast as possible
+    required.sort(key=len)
+
+    if not required:
+        return np.arange(len(index['placements']), dtype=np.uint32)
+
+    result = required[0]
+    for rows in required[1:]:
+        if len(result) == 0:
+            break
+        result = np.intersect1d(result, rows, assume_unique=True)
+    return result
+
+def query_placement_stats(index, all_of=(), any_of=()):
+    """
+    Computes placement statistics for the boards matching an AND/OR filter.
+
+    Parameters:
+    index (dict): An index created by build_match_index.
+    all_of (iterable, optional): Terms that must all be present on the board.
+    any_of (iterable, optional): Terms of which at least one must be present on the board.
+
+    Returns:
+    dict: The number of matching boards, average placement, top 4 rate, win rate and
+    the placement distribution (counts for placements 1-8).
+
+    Example:
+    stats = query_placement_stats(index, all_of=[('champion', 'TFT10_Ahri'), ('trait', 'Set10_KDA', 2)])
+    """
+    placements = index['placements'][query_rows(index, all_of, any_of)]
+    count = len(placements)
+    distribution = np.bincount(placements, minlength=9)[1:9]
+    if count == 0:
+        return {'count': 0, 'avg_placement': None, 'top4_rate': None,
+                'win_rate': None, 'distribution': distribution.tolist()}
+    return {
+        'count': count,
+        'avg_placement': float(placements.mean()),
+        'top4_rate': float(distribution[:4].sum() / count),
+        'win_rate': float(distribution[0] / count),
+        'distribution': distribution.tolist(),
+    }
+
+def query_boards(index, all_of=(), any_of=()):
+    """
+    Returns the matching boards as a DataFrame with match ID, PUUID and placement.
+
+    Parameters:
+    index (dict): An index created by build_match_index.
+    all_of (iterable, optional): Terms that must all be present on the board.
+    any_of (iterable, optional): Terms of which at least one must be present on the board.
+
+    Returns:
+    pd.DataFrame: One row per matching board.
+    """
+    rows = query_rows(index, all_of, any_of)
+    return pd.DataFrame({
+        'match_id': [index['rows'][row][0] for row in rows],
+        'puuid': [index['rows'][row][1] for row in rows],
+        'placement': index['placements'][rows],
+    })
+
+def save_match_index(index, path):
+    """
+    Saves an index to a .npz file so it can be reloaded without walking the matches again.
+
+    All posting lists are stored as one concatenated array with offsets, so loading
+    only needs to slice that array.
+
+    Parameters:
+    index (dict): An index created by build_match_index.
+    path (str): The file to write.
+
+    Example:
+    save_match_index(index, 'season_index.npz')
+    """
+    keys = [list(key) for key in index['postings']]
+    lists = list(index['postings'].values())
+    for name, tiers in index['traits'].items():
+        for tier, rows in tiers.items():
+            keys.append(['trait', name, tier])
+            lists.append(rows)
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(rows) for rows in lists])
+    values = np.concatenate(lists) if lists else np.empty(0, dtype=np.uint32)
+    np.savez(path, keys=np.array(json.dumps(keys)), offsets=offsets, values=values,
+             placements=index['placements'], rows=np.array(json.dumps(index['rows'])))
+
+def load_match_index(path):
+    """
+    Loads an index saved with save_match_index.
+
+    Parameters:
+    path (str): The .npz file to read.
+
+    Returns:
+    dict: The index, in the same form as returned by build_match_index.
+    """
+    with np.load(path) as data:
+        keys = json.loads(str(data['keys']))
+        offsets = data['offsets']
+        values = data['values']
+        placements = data['placements']
+        rows = [tuple(row) for row in json.loads(str(data['rows']))]
+
+    postings = {}
+    traits = defaultdict(dict)
+    for key, start, end in zip(keys, offsets[:-1], offsets[1:]):
+        if key[0] == 'trait':
+            traits[key[1]][key[2]] = values[start:end]
+        else:
+            postings[tuple(key)] = values[start:end]
+    return {'postings': postings, 'traits': dict(traits), 'placements': placements, 'rows': rows}
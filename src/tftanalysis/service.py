@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import aiohttp
+
+from tftanalysis import async_client
+from tftanalysis.match_history import summarize_match
+from tftanalysis.meta_analysis import frequency_analysis, correlation_analysis, generate_report
+
+# Seconds a fetched match history is reused before asking the API for new matches
+HISTORY_TTL = 60
+# Maximum number of matches whose details and analyses are kept in memory
+MAX_CACHED_MATCHES = 5000
+# Maximum number of players whose lookups, histories, reports and league entries are kept in memory
+MAX_CACHED_PLAYERS = 1000
+
+def _records(df):
+    """
+    Converts a DataFrame into a list of JSON-serializable records.
+    """
+    return json.loads(df.to_json(orient='records'))
+
+class _LRUCache:
+    """
+    Dictionary holding at most max_entries items, evicting the least recently used one.
+
+    Not thread-safe; AnalysisService only uses it while holding its lock.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key and marks it as recently used, or default if it is not cached.
+        """
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def __setitem__(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+class AnalysisService:
+    """
+    Memoizes match history, match analysis, meta reports and player info for one API key.
+
+    Match details and per-match analyses never change, so they are cached by match ID.
+    Meta reports and league entries are cached per player together with the match IDs
+    they were computed from, and are recomputed as soon as the match history lists a
+    new match. Every cache is bounded and evicts its least recently used entries, and
+    match histories are dropped once they are older than history_ttl.
+
+    All API requests go through one AsyncRiotClient running on a background event loop,
+    so the session and concurrency limit are shared by every consumer, and concurrent
+    misses for the same key wait on a single request.
+
+    Parameters:
+    api_key (str): The API key for Riot Games API.
+    history_ttl (int, optional): Seconds a match history is reused. Defaults to HISTORY_TTL.
+    concurrency (int, optional): Maximum number of requests in flight. Defaults to async_client.DEFAULT_CONCURRENCY.
+    max_matches (int, optional): Matches kept in the match and analysis caches. Defaults to MAX_CACHED_MATCHES.
+    max_players (int, optional): Players kept in the per-player caches. Defaults to MAX_CACHED_PLAYERS.
+    """
+
+    def __init__(self, api_key, history_ttl=HISTORY_TTL, concurrency=async_client.DEFAULT_CONCURRENCY,
+                 max_matches=MAX_CACHED_MATCHES, max_players=MAX_CACHED_PLAYERS):
+        self.api_key = api_key
+        self.history_ttl = history_ttl
+        self.client = async_client.AsyncRiotClient(api_key, concurrency=concurrency)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # Reentrant because a fetch that already finished runs its done callback immediately
+        self._lock = threading.RLock()
+        self._in_flight = {}
+        self._summoners = _LRUCache(max_players)
+        # Ordered by fetch time, so expired histories are always at the front
+        self._histories = OrderedDict()
+        self.max_players = max_players
+        self._matches = _LRUCache(max_matches)
+        self._analyses = _LRUCache(max_matches)
+        self._reports = _LRUCache(max_players)
+        self._league_entries = _LRUCache(max_players)
+
+    def close(self):
+        """
+        Closes the client session and stops the background event loop.
+        """
+        asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _submit(self, key, make_coroutine):
+        """
+        Schedules a client request on the background loop, or joins the one already running for key.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.run_coroutine_threadsafe(make_coroutine(), self._loop)
+                self._in_flight[key] = future
+                future.add_done_callback(lambda done: self._forget(key, done))
+            return future
+
+    def _forget(self, key, future):
+        """
+        Removes a finished request from the in-flight requests.
+        """
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _fetch(self, key, make_coroutine):
+        """
+        Runs a client request and waits for its result.
+        """
+        return self._submit(key, make_coroutine).result()
+
+    def summoner(self, summoner_name):
+        """
+        Returns the summoner ID and PUUID of a summoner, or (None, None) if an error occurs.
+        """
+        with self._lock:
+            cached = self._summoners.get(summoner_name)
+        if cached:
+            return cached
+        summoner_id, puuid = self._fetch(('summoner', summoner_name),
+                                         lambda: self.client.fetch_summoner_details(summoner_name))
+        if summoner_id and puuid:
+            with self._lock:
+                self._summoners[summoner_name] = (summoner_id, puuid)
+        return summoner_id, puuid
+
+    def match_history(self, puuid):
+        """
+        Returns the recent match IDs of a PUUID, or None if an error occurs.
+        """
+        with self._lock:
+            cached = self._histories.get(puuid)
+        if cached and time.monotonic() - cached[0] < self.history_ttl:
+            return cached[1]
+        match_ids = self._fetch(('history', puuid), lambda: self.client.fetch_match_history(puuid))
+        if match_ids is not None:
+            with self._lock:
+                now = time.monotonic()
+                self._histories.pop(puuid, None)
+                self._histories[puuid] = (now, match_ids)
+                while self._histories:
+                    fetched_at, _ = next(iter(self._histories.values()))
+                    if now - fetched_at < self.history_ttl and len(self._histories) <= self.max_players:
+                        break
+                    self._histories.popitem(last=False)
+        return match_ids
+
+    def matches(self, match_ids):
+        """
+        Returns the details of the given matches, fetching only the ones not cached yet.
+
+        Matches that could not be fetched are left out.
+        """
+        with self._lock:
+            found = {match_id: self._matches.get(match_id) for match_id in match_ids}
+        missing = [match_id for match_id, match in found.items() if match is None]
+        # Submit every missing match first so they are fetched concurrently
+        futures = [(match_id, self._submit(('match', match_id),
+                                           lambda match_id=match_id: self.client.fetch_match_details(match_id)))
+                   for match_id in missing]
+        for match_id, future in futures:
+            match = future.result()
+            if match:
+                found[match_id] = match
+                with self._lock:
+                    self._matches[match_id] = match
+        # Results are returned from found rather than the cache, which may already have evicted them
+        return [found[match_id] for match_id in match_ids if found[match_id]]
+
+    def match_analysis(self, match_id):
+        """
+        Returns the participants, traits and items analysis of a match, or None if it cannot be fetched.
+        """
+        with self._lock:
+            cached = self._analyses.get(match_id)
+        if cached:
+            return cached
+        matches = self.matches([match_id])
+        if not matches:
+            return None
+        participants_summary_df, traits_df, items_df = summarize_match(matches[0])
+        analysis = {
+            'match_id': match_id,
+            'participants': _records(participants_summary_df),
+            'traits': _records(traits_df),
+            'items': _records(items_df),
+        }
+        with self._lock:
+            self._analyses[match_id] = analysis
+        return analysis
+
+    def meta_report(self, puuid):
+        """
+        Returns the meta analysis report of the recent matches of a PUUID, or None if an error occurs.
+        """
+        match_ids = self.match_history(puuid)
+        if not match_ids:
+            return None
+        key = tuple(match_ids)
+        with self._lock:
+            cached = self._reports.get(puuid)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        matches = self.matches(match_ids)
+        champion_count, trait_count, item_count = frequency_analysis(matches)
+        top_placement_patterns = correlation_analysis(matches)
+        report = {
+            'puuid': puuid,
+            'match_ids': [match['metadata']['match_id'] for match in matches],
+            'report': generate_report(champion_count, trait_count, item_count, top_placement_patterns, len(matches)),
+            'champions': dict(champion_count.most_common(10)),
+            'traits': dict(trait_count.most_common(10)),
+            'items': dict(item_count.most_common(10)),
+            'top_placement_patterns': [
+                {'champions': sorted(pattern), 'count': count}
+                for pattern, count in top_placement_patterns.most_common(5)
+            ],
+        }
+        # A report missing failed matches is served but not memoized, so they are retried
+        if len(matches) == len(match_ids):
+            with self._lock:
+                self._reports[puuid] = (key, report)
+        return report
+
+    def player_info(self, summoner_name):
+        """
+        Returns the TFT league entries of a summoner, or None if an error occurs.
+        """
+        summoner_id, puuid = self.summoner(summoner_name)
+        if not summoner_id:
+            return None
+        # League entries only change once a new match has been played
+        key = tuple(self.match_history(puuid) or ())
+        with self._lock:
+            cached = self._league_entries.get(summoner_id)
+        if cached and cached[0] == key:
+            return cached[1]
+        entries = self._fetch(('league', summoner_id), lambda: self.client.fetch_tft_league_entries(summoner_id))
+        if entries is not None:
+            with self._lock:
+                self._league_entries[summoner_id] = (key, entries)
+        return entries
+
+def make_handler(service):
+    """
+    Creates a request handler class exposing the service as JSON endpoints.
+
+    Endpoints:
+    GET /match-history?summoner_name=NAME or ?puuid=PUUID
+    GET /match-analysis?match_id=MATCH_ID
+    GET /meta-report?summoner_name=NAME or ?puuid=PUUID
+    GET /player-info?summoner_name=NAME
+    """
+    class AnalysisRequestHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _puuid(self, params):
+            if 'puuid' in params:
+                return params['puuid']
+            if 'summoner_name' in params:
+                return service.summoner(params['summoner_name'])[1]
+            return None
+
+        def do_GET(self):
+            try:
+                self._dispatch()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                self.log_error("Riot Games API request failed: %r", error)
+                self._send_json(502, {'error': 'Failed to reach the Riot Games API.'})
+            except Exception as error:
+                self.log_error("Request failed: %r", error)
+                self._send_json(500, {'error': 'Internal server error.'})
+
+        def _dispatch(self):
+            parsed = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+            if parsed.path in ('/match-history', '/meta-report'):
+                if 'puuid' not in params and 'summoner_name' not in params:
+                    return self._send_json(400, {'error': 'summoner_name or puuid is required'})
+                puuid = self._puuid(params)
+                if not puuid:
+                    return self._send_json(404, {'error': 'Summoner name not found or an error occurred.'})
+                if parsed.path == '/match-history':
+                    match_ids = service.match_history(puuid)
+                    result = None if match_ids is None else {'puuid': puuid, 'match_ids': match_ids}
+                else:
+                    result = service.meta_report(puuid)
+            elif parsed.path == '/match-analysis':
+                if 'match_id' not in params:
+                    return self._send_json(400, {'error': 'match_id is required'})
+                result = service.match_analysis(params['match_id'])
+            elif parsed.path == '/player-info':
+                if 'summoner_name' not in params:
+                    return self._send_json(400, {'error': 'summoner_name is required'})
+                result = service.player_info(params['summoner_name'])
+            else:
+                return self._send_json(404, {'error': f"Unknown endpoint: {parsed.path}"})
+
+            if result is None:
+                return self._send_json(404, {'error': 'No data found or an error occurred.'})
+            return self._send_json(200, result)
+
+    return AnalysisRequestHandler
+
+def run_service(api_key, host='127.0.0.1', port=8000):
+    """
+    Runs the analysis service until interrupted.
+
+    Parameters:
+    api_key (str): The API key for Riot Games API.
+    host (str, optional): The address to listen on. Defaults to '127.0.0.1'.
+    port (int, optional): The port to listen on. Defaults to 8000.
+    """
+    service = AnalysisService(api_key)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"Serving TFT analysis on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+def main():
+    """
+    Main function to run the service.
+    """
+    api_key = input("Please enter your Riot API Key: ").strip()
+    if not api_key:
+        print("API Key is required to proceed. Exiting the program.")
+        return
+    run_service(api_key)
+
+if __name__ == "__main__":
+    main()
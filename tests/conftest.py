@@ -0,0 +1,34 @@
+import pytest
+
+@pytest.fixture
+def make_participant():
+    def make(puuid, placement, units, traits, **stats):
+        participant = {
+            "puuid": puuid,
+            "placement": placement,
+            "level": 8,
+            "gold_left": 10,
+            "players_eliminated": 0,
+            "time_eliminated": 2000.0,
+            "total_damage_to_players": 50 * (9 - placement),
+            "units": [{"character_id": champ, "itemNames": items} for champ, items in units],
+            "traits": [{"name": name, "tier_current": tier} for name, tier in traits],
+        }
+        participant.update(stats)
+        return participant
+    return make
+
+@pytest.fixture
+def match_data(make_participant):
+    return [
+        {"metadata": {"match_id": "match1"},
+         "info": {"participants": [
+             make_participant("p1", 1, [("Ahri", ["Gauntlet"]), ("Lux", [])], [("Mage", 2), ("Star", 1)]),
+             make_participant("p2", 5, [("Ahri", [])], [("Mage", 1), ("Tank", 0)]),
+         ]}},
+        {"metadata": {"match_id": "match2"},
+         "info": {"participants": [
+             make_participant("p1", 3, [("Lux", ["Gauntlet"]), ("Ahri", [])], [("Mage", 1), ("Star", 1)]),
+             make_participant("p3", 8, [("Garen", ["Vest"])], [("Tank", 1)]),
+         ]}},
+    ]
@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from tftanalysis.async_client import (AsyncRiotClient, fetch_summoner_details, fetch_match_history,
+                                      fetch_many_match_details)
+
+class FakeResponse:
+    def __init__(self, session, status, data):
+        self.session = session
+        self.status = status
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *args):
+        self.session.in_flight -= 1
+        return False
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, headers=None):
+        assert headers == {"X-Riot-Token": "test_api_key"}
+        status, data = self.responses.get(url, (404, None))
+        return FakeResponse(self, status, data)
+
+@pytest.fixture
+def session():
+    return FakeSession({
+        "https://na1.api.riotgames.com/lol/summoner/v4/summoners/by-name/test_summoner":
+            (200, {"id": "test_id", "puuid": "test_puuid"}),
+        "https://americas.api.riotgames.com/tft/match/v1/matches/by-puuid/test_puuid/ids?start=0&count=20":
+            (200, ["match1", "match2"]),
+        "https://americas.api.riotgames.com/tft/match/v1/matches/match1":
+            (200, {"metadata": {"match_id": "match1"}}),
+    })
+
+def run(coroutine_function):
+    async def runner():
+        return await coroutine_function(asyncio.Semaphore(10))
+    return asyncio.run(runner())
+
+def test_fetch_summoner_details(session):
+    assert run(lambda semaphore: fetch_summoner_details(session, "test_summoner", "test_api_key", semaphore)) == ("test_id", "test_puuid")
+    assert run(lambda semaphore: fetch_summoner_details(session, "unknown", "test_api_key", semaphore)) == (None, None)
+
+def test_fetch_match_history(session):
+    assert run(lambda semaphore: fetch_match_history(session, "test_puuid", "test_api_key", semaphore)) == ["match1", "match2"]
+
+def test_fetch_many_match_details(session):
+    matches = run(lambda semaphore: fetch_many_match_details(session, ["match1", "match2"], "test_api_key", semaphore))
+    assert matches == [{"metadata": {"match_id": "match1"}}, None]
+
+def test_client_shares_one_semaphore(session):
+    async def fetch():
+        client = AsyncRiotClient("test_api_key", concurrency=2, session=session)
+        # Separate bulk calls and single lookups still share the client's limit
+        return await asyncio.gather(
+            client.fetch_many_match_details(["match1"] * 5),
+            client.fetch_many_match_details(["match2"] * 5),
+            client.fetch_match_details("match1"),
+        )
+
+    first, second, single = asyncio.run(fetch())
+    assert first == [{"metadata": {"match_id": "match1"}}] * 5
+    assert second == [None] * 5
+    assert single == {"metadata": {"match_id": "match1"}}
+    assert session.max_in_flight == 2
+
+def test_client_reused_after_close_in_new_loop(session):
+    client = AsyncRiotClient("test_api_key", concurrency=1, session=session)
+
+    async def fetch():
+        try:
+            return await client.fetch_many_match_details(["match1"] * 3)
+        finally:
+            await client.close()
+
+    assert asyncio.run(fetch()) == [{"metadata": {"match_id": "match1"}}] * 3
+    assert asyncio.run(fetch()) == [{"metadata": {"match_id": "match1"}}] * 3
@@ -0,0 +1,71 @@
+import pytest
+from tftanalysis.cooccurrence import build_cooccurrence, cooccurrence_frame
+
+KINDS = ["champion_item", "champion_champion", "trait_trait"]
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_champion_item(match_data, batch_size):
+    cooccurrence = build_cooccurrence(match_data, batch_size=batch_size)
+    pairs_df = cooccurrence_frame(cooccurrence, "champion_item")
+    assert len(pairs_df) == 3
+    ahri = pairs_df[(pairs_df["First"] == "Ahri") & (pairs_df["Second"] == "Gauntlet")].iloc[0]
+    assert ahri["Count"] == 1
+    assert ahri["Average Placement"] == 1
+
+@pytest.fixture
+def item_matches(make_participant):
+    return [
+        {"info": {"participants": [
+            make_participant("p1", 1, [("Ahri", ["Gauntlet"])], []),
+            make_participant("p2", 5, [("Ahri", ["Gauntlet", "Vest"])], []),
+        ]}},
+        # Lux and Sword only appear in the second batch when batch_size is 1
+        {"info": {"participants": [
+            make_participant("p1", 3, [("Lux", ["Sword"])], []),
+            make_participant("p2", 7, [("Ahri", ["Gauntlet"])], []),
+        ]}},
+    ]
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_champion_item_across_batches(item_matches, batch_size):
+    cooccurrence = build_cooccurrence(item_matches, batch_size=batch_size)
+    assert cooccurrence["champion_item"].shape == (2, 3)
+    assert cooccurrence["champion_units"].tolist() == [3, 1]
+    assert cooccurrence["item_units"].tolist() == [3, 1, 1]
+    pairs_df = cooccurrence_frame(cooccurrence, "champion_item").set_index(["First", "Second"])
+    assert pairs_df.index.tolist() == [("Ahri", "Gauntlet"), ("Lux", "Sword"), ("Ahri", "Vest")]
+    assert pairs_df.loc[("Ahri", "Gauntlet"), "Count"] == 3
+    assert pairs_df.loc[("Ahri", "Gauntlet"), "Average Placement"] == pytest.approx(13 / 3)
+    assert pairs_df.loc[("Ahri", "Vest"), "Average Placement"] == 5
+    # 4 units in total: Ahri holds 3 of the 3 Gauntlets on 3 of its 3 units
+    assert pairs_df.loc[("Ahri", "Gauntlet"), "Lift"] == pytest.approx(3 * 4 / (3 * 3))
+    assert pairs_df.loc[("Lux", "Sword"), "Lift"] == pytest.approx(4)
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_champion_and_trait_pairs(match_data, batch_size):
+    cooccurrence = build_cooccurrence(match_data, batch_size=batch_size)
+    champions_df = cooccurrence_frame(cooccurrence, "champion_champion")
+    assert champions_df[["First", "Second"]].values.tolist() == [["Ahri", "Lux"]]
+    assert champions_df["Average Placement"][0] == 2
+    # Ahri and Lux are on 3 and 2 of 4 boards, together on 2
+    assert champions_df["Lift"][0] == pytest.approx(2 * 4 / (3 * 2))
+    traits_df = cooccurrence_frame(cooccurrence, "trait_trait")
+    assert traits_df[["First", "Second", "Count"]].values.tolist() == [["Mage", "Star", 2]]
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_min_count_above_every_pair(match_data, kind):
+    pairs_df = cooccurrence_frame(build_cooccurrence(match_data), kind, min_count=5)
+    assert pairs_df.empty
+    assert list(pairs_df.columns) == ["First", "Second", "Count", "Average Placement", "Lift"]
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_empty_corpus(kind):
+    cooccurrence = build_cooccurrence([])
+    assert cooccurrence["boards"] == 0
+    assert cooccurrence_frame(cooccurrence, kind).empty
+
+def test_boards_without_pairs(make_participant):
+    matches = [{"info": {"participants": [make_participant("p1", 1, [("Ahri", [])], [("Mage", 1)])]}}]
+    cooccurrence = build_cooccurrence(matches)
+    for kind in KINDS:
+        assert cooccurrence_frame(cooccurrence, kind).empty
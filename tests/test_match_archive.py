@@ -0,0 +1,78 @@
+import pytest
+from tftanalysis.match_archive import MatchArchive
+from tftanalysis.meta_analysis import frequency_analysis
+
+def make_match(i):
+    return {"metadata": {"match_id": f"NA1_{i}"},
+            "info": {"participants": [
+                {"placement": placement, "puuid": f"puuid_{i}_{placement}",
+                 "units": [{"character_id": f"TFT10_Champion{(i + placement + k) % 13}",
+                            "itemNames": [f"TFT_Item_{(i * k + placement) % 9}"]} for k in range(6)],
+                 "traits": [{"name": f"Set10_Trait{(i + k) % 7}", "tier_current": k % 3} for k in range(4)]}
+                for placement in range(1, 9)]}}
+
+@pytest.fixture
+def archive(tmp_path):
+    matches = [make_match(i) for i in range(300)]
+    with MatchArchive.create(str(tmp_path / "archive"), matches, dict_size=16 * 1024) as archive:
+        archive.append(matches[:200])
+        yield archive
+
+def test_random_access(archive):
+    assert len(archive) == 200
+    assert archive.get("NA1_42") == make_match(42)
+    assert archive.get("NA1_250") is None
+
+def test_append_is_idempotent_and_persistent(archive, tmp_path):
+    assert archive.append([make_match(i) for i in range(150, 250)]) == 50
+    archive.close()
+    with MatchArchive(str(tmp_path / "archive")) as reopened:
+        assert len(reopened) == 250
+        assert reopened.match_ids()[-1] == "NA1_249"
+        assert reopened.get("NA1_249") == make_match(249)
+
+def test_streaming_into_frequency_analysis(archive):
+    expected = frequency_analysis([make_match(i) for i in range(200)])
+    assert frequency_analysis(archive) == expected
+    assert [match["metadata"]["match_id"] for match in archive.iter_matches(["NA1_3", "missing"])] == ["NA1_3"]
+
+def test_partial_index_line_is_ignored_then_repaired(archive, tmp_path):
+    path = tmp_path / "archive"
+    archive.close()
+    with open(path / "index.tsv", "a", encoding="utf-8") as f:
+        f.write("NA1_200\t12")
+    size = (path / "index.tsv").stat().st_size
+    with MatchArchive(str(path)) as reader:
+        assert len(reader) == 200
+    # Reading leaves the file untouched
+    assert (path / "index.tsv").stat().st_size == size
+    with MatchArchive(str(path)) as writer:
+        assert writer.append([make_match(200), make_match(201)]) == 2
+    with MatchArchive(str(path)) as reopened:
+        assert len(reopened) == 202
+        assert reopened.get("NA1_200") == make_match(200)
+        assert reopened.get("NA1_201") == make_match(201)
+
+def test_corrupt_index_line_raises(archive, tmp_path):
+    path = tmp_path / "archive"
+    archive.close()
+    lines = (path / "index.tsv").read_text().splitlines(keepends=True)
+    lines[5] = "garbage\n"
+    (path / "index.tsv").write_text("".join(lines))
+    with pytest.raises(ValueError):
+        MatchArchive(str(path))
+
+def test_append_closes_unused_map(archive):
+    archive.get("NA1_1")
+    old_map = archive._mmap
+    archive.append([make_match(200)])
+    assert old_map.closed
+
+def test_append_during_stream_keeps_map_open(archive):
+    stream = archive.iter_matches()
+    first = next(stream)
+    archive.append([make_match(200)])
+    rest = list(stream)
+    assert len(rest) == 199 and first == make_match(0)
+    assert archive.get("NA1_200") == make_match(200)
+    assert archive._readers == {}
@@ -0,0 +1,76 @@
+import asyncio
+from tftanalysis import async_client
+from tftanalysis.match_history import analyze_match_history, analyze_player_history, fetch_all_match_details
+
+def test_analyze_match_history(match_data):
+    history = analyze_match_history("p1", match_data + [None])
+    assert history["games"]["match_id"].tolist() == ["match1", "match2"]
+    summary = history["summary"].iloc[0]
+    assert summary["Games"] == 2
+    assert summary["Average Placement"] == 2
+    assert summary["Top 4 Rate"] == 1
+    assert summary["Average Damage"] == (400 + 300) / 2
+    assert history["placements"]["Games"].tolist() == [1, 0, 1, 0, 0, 0, 0, 0]
+
+def test_traits_and_items(match_data):
+    history = analyze_match_history("p1", match_data)
+    traits = history["traits"].set_index("Trait")
+    assert sorted(traits.index) == ["Mage", "Star"]
+    assert traits.loc["Mage", "Games"] == 2
+    items = history["items"].set_index("Item")
+    assert items.index.tolist() == ["Gauntlet"]
+    assert items.loc["Gauntlet", "Average Placement"] == 2
+
+def test_duplicate_items_count_once_per_game(make_participant):
+    matches = [
+        {"metadata": {"match_id": "match1"}, "info": {"participants": [
+            make_participant("test_puuid", 1, [("Ahri", ["Gauntlet", "Gauntlet"]), ("Lux", ["Gauntlet"])], [])]}},
+        {"metadata": {"match_id": "match2"}, "info": {"participants": [
+            make_participant("test_puuid", 8, [("Ahri", ["Gauntlet"])], [])]}},
+    ]
+    gauntlet = analyze_match_history("test_puuid", matches)["items"].iloc[0]
+    assert gauntlet["Games"] == 2
+    assert gauntlet["Average Placement"] == 4.5
+    assert gauntlet["Top 4 Rate"] == 0.5
+
+def test_boards_without_traits(make_participant):
+    matches = [{"metadata": {"match_id": "match1"}, "info": {"participants": [
+        make_participant("test_puuid", 2, [("Ahri", [])], [("Mage", 0)])]}}]
+    history = analyze_match_history("test_puuid", matches)
+    assert history["traits"].empty
+    assert history["items"].empty
+
+def test_missing_stat_columns(make_participant):
+    participant = make_participant("test_puuid", 2, [("Ahri", [])], [])
+    del participant["total_damage_to_players"]
+    history = analyze_match_history("test_puuid", [{"metadata": {"match_id": "match1"}, "info": {"participants": [participant]}}])
+    assert "Average Damage" not in history["summary"].columns
+    assert "total_damage_to_players" not in history["games"].columns
+
+def test_unknown_player(match_data):
+    assert analyze_match_history("unknown", match_data) is None
+
+def test_fetch_all_match_details_inside_running_loop(match_data, monkeypatch):
+    details = {match["metadata"]["match_id"]: match for match in match_data}
+
+    async def fetch_match_details(session, match_id, api_key, semaphore):
+        return details.get(match_id)
+
+    monkeypatch.setattr(async_client, "fetch_match_details", fetch_match_details)
+
+    async def call_from_async_code():
+        return fetch_all_match_details(["match1", "missing", "match2"], "test_api_key")
+
+    assert asyncio.run(call_from_async_code()) == match_data
+    assert fetch_all_match_details(["match2"], "test_api_key") == match_data[1:]
+
+def test_analyze_player_history_with_client(match_data):
+    class FakeClient:
+        async def fetch_match_history(self, puuid):
+            return ["match1", "match2"]
+
+        async def fetch_many_match_details(self, match_ids):
+            return match_data
+
+    history = asyncio.run(analyze_player_history(FakeClient(), "p1"))
+    assert history["summary"].iloc[0]["Games"] == 2
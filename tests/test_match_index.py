@@ -0,0 +1,44 @@
+from tftanalysis.match_index import (build_match_index, query_placement_stats, query_boards,
+                                     save_match_index, load_match_index)
+
+def test_champion_item_query(match_data):
+    index = build_match_index(match_data)
+    stats = query_placement_stats(index, all_of=[("champion_item", "Ahri", "Gauntlet")])
+    assert stats["count"] == 1
+    assert stats["avg_placement"] == 1
+
+def test_and_or_query(match_data):
+    index = build_match_index(match_data)
+    stats = query_placement_stats(index, all_of=[("trait", "Mage", 1)], any_of=[("champion", "Ahri"), ("item", "Gauntlet")])
+    assert stats["count"] == 3
+    assert stats["distribution"] == [1, 0, 1, 0, 1, 0, 0, 0]
+    assert query_placement_stats(index, all_of=[("trait", "Mage", 2)])["count"] == 1
+    assert query_placement_stats(index, all_of=[("trait", "Tank", 1)])["count"] == 1
+
+def test_query_boards(match_data):
+    index = build_match_index(match_data)
+    boards = query_boards(index, all_of=[("item", "Gauntlet")])
+    assert boards["match_id"].tolist() == ["match1", "match2"]
+    assert query_placement_stats(index, all_of=[("champion", "Unknown")])["count"] == 0
+
+def test_empty_corpus():
+    index = build_match_index([])
+    assert query_placement_stats(index)["count"] == 0
+    assert query_placement_stats(index, all_of=[("trait", "Mage", 1)])["distribution"] == [0] * 8
+    assert query_boards(index, any_of=[("champion", "Ahri")]).empty
+
+def test_save_and_load(match_data, tmp_path):
+    index = build_match_index(match_data)
+    path = str(tmp_path / "index.npz")
+    save_match_index(index, path)
+    loaded = load_match_index(path)
+    terms = [("trait", "Mage", 1), ("champion", "Lux")]
+    assert query_placement_stats(loaded, all_of=terms) == query_placement_stats(index, all_of=terms)
+    assert query_boards(loaded, all_of=terms).equals(query_boards(index, all_of=terms))
+
+def test_empty_term_generators(match_data):
+    index = build_match_index(match_data)
+    stats = query_placement_stats(index, all_of=(term for term in []), any_of=(term for term in []))
+    assert stats["count"] == 4
+    stats = query_placement_stats(index, all_of=(term for term in [("champion", "Lux")]), any_of=(term for term in []))
+    assert stats["count"] == 2
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import aiohttp
+import pytest
+from tftanalysis import async_client
+from tftanalysis.service import AnalysisService, make_handler
+
+def make_match(match_id):
+    participant = {"placement": 1, "level": 8, "gold_left": 2, "players_eliminated": 1,
+                   "time_eliminated": 2000.0, "total_damage_to_players": 100,
+                   "traits": [{"name": "Mage", "tier_current": 1}],
+                   "units": [{"character_id": "Ahri", "itemNames": ["Gauntlet"]}]}
+    return {"metadata": {"match_id": match_id}, "info": {"participants": [participant]}}
+
+@pytest.fixture
+def api(monkeypatch):
+    api = {"history": ["match1"], "details": [], "failing": set(), "error": None, "delay": 0}
+
+    async def fetch_match_history(session, puuid, api_key, semaphore):
+        if api["error"]:
+            raise api["error"]
+        return api["history"]
+
+    async def fetch_match_details(session, match_id, api_key, semaphore):
+        api["details"].append(match_id)
+        if api["delay"]:
+            await asyncio.sleep(api["delay"])
+        return None if match_id in api["failing"] else make_match(match_id)
+
+    monkeypatch.setattr(async_client, "fetch_match_history", fetch_match_history)
+    monkeypatch.setattr(async_client, "fetch_match_details", fetch_match_details)
+    return api
+
+@pytest.fixture
+def service(api):
+    service = AnalysisService("test_api_key", history_ttl=0)
+    yield service
+    service.close()
+
+def test_match_analysis_is_memoized(api, service):
+    first = service.match_analysis("match1")
+    assert service.match_analysis("match1") is first
+    assert first["items"][0]["Item"] == "Gauntlet"
+    assert api["details"] == ["match1"]
+
+def test_meta_report_invalidated_by_new_match(api, service):
+    report = service.meta_report("test_puuid")
+    assert service.meta_report("test_puuid") is report
+    api["history"] = ["match2", "match1"]
+    updated = service.meta_report("test_puuid")
+    assert updated is not report
+    assert updated["match_ids"] == ["match2", "match1"]
+    # Only the new match is fetched again
+    assert api["details"] == ["match1", "match2"]
+
+def test_partial_meta_report_is_not_memoized(api, service):
+    api["history"] = ["match1", "match2"]
+    api["failing"] = {"match2"}
+    partial = service.meta_report("test_puuid")
+    assert partial["match_ids"] == ["match1"]
+    api["failing"] = set()
+    complete = service.meta_report("test_puuid")
+    assert complete["match_ids"] == ["match1", "match2"]
+    assert service.meta_report("test_puuid") is complete
+
+def test_concurrent_misses_share_one_fetch(api, service):
+    api["delay"] = 0.1
+    threads = [threading.Thread(target=service.match_analysis, args=("match1",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert api["details"] == ["match1"]
+
+@pytest.fixture
+def server(service):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(service))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+def test_endpoints(api, server):
+    status, body = get(f"{server}/match-history?puuid=test_puuid")
+    assert (status, body) == (200, {"puuid": "test_puuid", "match_ids": ["match1"]})
+    status, body = get(f"{server}/match-analysis?match_id=match1")
+    assert status == 200 and body["match_id"] == "match1"
+    assert get(f"{server}/match-analysis")[0] == 400
+    assert get(f"{server}/unknown")[0] == 404
+
+def test_api_errors_return_json(api, server):
+    api["error"] = aiohttp.ClientConnectionError("connection refused")
+    status, body = get(f"{server}/meta-report?puuid=test_puuid")
+    assert status == 502
+    assert body == {"error": "Failed to reach the Riot Games API."}
+    api["error"] = RuntimeError("unexpected")
+    assert get(f"{server}/match-history?puuid=test_puuid")[0] == 500
+
+def test_match_caches_are_bounded(api):
+    service = AnalysisService("test_api_key", max_matches=2)
+    try:
+        api["history"] = ["match1", "match2", "match3"]
+        report = service.meta_report("test_puuid")
+        # All matches are analyzed even though only two stay cached
+        assert report["match_ids"] == ["match1", "match2", "match3"]
+        assert len(service._matches) == 2
+        for match_id in ["match1", "match2", "match3"]:
+            service.match_analysis(match_id)
+        assert len(service._analyses) == 2
+        assert "match1" not in service._analyses
+    finally:
+        service.close()
+
+def test_expired_histories_are_dropped(api):
+    service = AnalysisService("test_api_key", history_ttl=0.05, max_players=2)
+    try:
+        service.match_history("player1")
+        time.sleep(0.1)
+        service.match_history("player2")
+        assert list(service._histories) == ["player2"]
+        service.meta_report("player3")
+        service.meta_report("player4")
+        assert len(service._reports) == 2
+    finally:
+        service.close()